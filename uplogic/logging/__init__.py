@@ -15,6 +15,28 @@ from contextlib import redirect_stderr
 from datetime import datetime
 
 
+_LOG_LEVELS = {
+    'DEBUG': 10,
+    'INFO': 20,
+    'SUCCESS': 25,
+    'WARNING': 30,
+    'ERROR': 40
+}
+_log_level = 0
+
+
+def set_log_level(type='DEBUG'):
+    """Suppress messages below the given type; `log` calls with a filtered
+    type become no-ops."""
+    global _log_level
+    _log_level = _LOG_LEVELS.get(type, 0)
+
+
+def log_enabled(type='INFO') -> bool:
+    """Whether a message of the given type would currently be shown."""
+    return _LOG_LEVELS.get(type, 20) >= _log_level
+
+
 def set_depth(depth):
     LoggerLayout.max_msg = depth
 
@@ -134,6 +156,8 @@ def get_logger(create=False, toggle_key='BACKSLASH', visible=False) -> LoggerLay
 
 
 def log(msg, type='INFO'):
+    if not log_enabled(type):
+        return
     logger = get_logger()
     if logger is None:
         print(msg)
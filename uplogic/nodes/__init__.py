@@ -174,6 +174,28 @@ class ULLogicNode(ULLogicContainer):
         else:
             return param
 
+    def _resolve(self, name):
+        """Resolve the input stored under `name` to a zero-argument getter.
+
+        Sockets and literals are told apart once instead of on every call
+        to `get_input`; the getter is stored as `self._in_<name>` so hot
+        `evaluate` implementations can call it directly.
+        """
+        param = getattr(self, name)
+        if isinstance(param, ULLogicBase):
+            def getter(param=param):
+                if param.has_status(STATUS_READY):
+                    return param.get_value()
+                return STATUS_WAITING
+        elif str(param).startswith('NLO:'):
+            def getter(param=param):
+                return self.get_input(param)
+        else:
+            def getter(param=param):
+                return param
+        setattr(self, '_in_' + name, getter)
+        return getter
+
 
 class ULParameterNode(ULLogicNode):
     pass
@@ -2,6 +2,7 @@ from uplogic.nodes import ULActionNode
 from uplogic.nodes import ULOutSocket
 from uplogic.utils import not_met
 from uplogic.logging import log
+from uplogic.logging import log_enabled
 
 
 class ULPrintValue(ULActionNode):
@@ -12,6 +13,7 @@ class ULPrintValue(ULActionNode):
         self.value = None
         self.done = None
         self.msg_type = 'INFO'
+        self._in_condition = None
         self.OUT = ULOutSocket(self, self.get_done)
 
     def get_done(self):
@@ -19,10 +21,15 @@ class ULPrintValue(ULActionNode):
 
     def evaluate(self):
         self.done = False
-        condition = self.get_input(self.condition)
+        if self._in_condition is None:
+            self._resolve('condition')
+            self._resolve('value')
+        condition = self._in_condition()
         if not_met(condition):
             return
-        value = self.get_input(self.value)
         self._set_ready()
-        log(value, self.msg_type)
+        if log_enabled(self.msg_type):
+            # Only pull the value socket when the message will actually be
+            # shown; filtered prints skip their whole input subtree.
+            log(self._in_value(), self.msg_type)
         self.done = True
@@ -1,6 +1,6 @@
 from uplogic.nodes import ULActionNode
 from uplogic.nodes import ULOutSocket
-from uplogic.utils import is_waiting
+from uplogic.utils.constants import STATUS_WAITING
 from uplogic.utils import is_invalid
 from uplogic.utils import not_met
 
@@ -14,6 +14,9 @@ class ULSetBoneConstraintInfluence(ULActionNode):
         self.constraint = None
         self.influence = None
         self.done = None
+        self._in_condition = None
+        self._cached_key = None
+        self._cached_constraint = None
         self.OUT = ULOutSocket(self, self.get_done)
 
     def get_done(self):
@@ -21,29 +24,38 @@ class ULSetBoneConstraintInfluence(ULActionNode):
 
     def evaluate(self):
         self.done = False
-        condition = self.get_input(self.condition)
+        if self._in_condition is None:
+            self._resolve('condition')
+            self._resolve('armature')
+            self._resolve('bone')
+            self._resolve('constraint')
+            self._resolve('influence')
+        condition = self._in_condition()
         if not_met(condition):
             return
-        armature = self.get_input(self.armature)
-        bone = self.get_input(self.bone)
-        constraint = self.get_input(self.constraint)
-        influence = self.get_input(self.influence)
-        if is_waiting(
-            armature,
-            bone,
-            constraint,
-            influence
+        armature = self._in_armature()
+        bone = self._in_bone()
+        constraint = self._in_constraint()
+        influence = self._in_influence()
+        if (
+            armature is STATUS_WAITING or
+            bone is STATUS_WAITING or
+            constraint is STATUS_WAITING or
+            influence is STATUS_WAITING
         ):
             return
         self._set_ready()
         if is_invalid(armature):
             return
-        (
-            armature
-            .blenderObject
-            .pose
-            .bones[bone]
-            .constraints[constraint]
-            .influence
-        ) = influence
+        key = (id(armature), bone, constraint)
+        if key != self._cached_key:
+            self._cached_constraint = (
+                armature
+                .blenderObject
+                .pose
+                .bones[bone]
+                .constraints[constraint]
+            )
+            self._cached_key = key
+        self._cached_constraint.influence = influence
         self.done = True
@@ -1,6 +1,6 @@
 from uplogic.nodes import ULActionNode
 from uplogic.nodes import ULOutSocket
-from uplogic.utils import is_waiting
+from uplogic.utils.constants import STATUS_WAITING
 from uplogic.utils import is_invalid
 from uplogic.utils import not_met
 
@@ -12,6 +12,7 @@ class ULSetCameraOrthoScale(ULActionNode):
         self.camera = None
         self.scale = None
         self.done = None
+        self._in_condition = None
         self.OUT = ULOutSocket(self, self.get_done)
 
     def get_done(self):
@@ -19,12 +20,16 @@ class ULSetCameraOrthoScale(ULActionNode):
 
     def evaluate(self):
         self.done = False
-        condition = self.get_input(self.condition)
+        if self._in_condition is None:
+            self._resolve('condition')
+            self._resolve('camera')
+            self._resolve('scale')
+        condition = self._in_condition()
         if not_met(condition):
             return
-        camera = self.get_input(self.camera)
-        scale = self.get_input(self.scale)
-        if is_waiting(camera, scale):
+        camera = self._in_camera()
+        scale = self._in_scale()
+        if camera is STATUS_WAITING or scale is STATUS_WAITING:
             return
         self._set_ready()
         if is_invalid(camera):
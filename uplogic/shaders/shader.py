@@ -1,10 +1,12 @@
 from bge import logic
+from functools import lru_cache
 from mathutils import Vector, Matrix
 from uplogic.utils.errors import PassIndexOccupiedError
 from uplogic.utils import debug
 from pathlib import Path
 
 
+@lru_cache(maxsize=32)
 def load_glsl(filepath: str):
     return Path(filepath).read_text()
 
@@ -2,10 +2,64 @@ from .widget import Widget
 from .behaviors import HoverBehavior
 from .label import Label
 import gpu
-from uplogic.input.mouse import MOUSE_EVENTS, LMB, RMB
+from gpu_extras.batch import batch_for_shader
 from uplogic.utils import debug
 
 
+_vertex_shader = """
+uniform mat4 ModelViewProjectionMatrix;
+in vec2 pos;
+in vec2 uv;
+out vec2 uv_interp;
+
+void main()
+{
+    uv_interp = uv;
+    gl_Position = ModelViewProjectionMatrix * vec4(pos, 0.0, 1.0);
+}
+"""
+
+
+_fragment_shader = """
+uniform vec4 color;
+uniform vec4 border_color;
+uniform float border_width;
+uniform vec2 size;
+in vec2 uv_interp;
+out vec4 fragColor;
+
+void main()
+{
+    // Distance to the nearest rect edge in pixels; fragments inside the
+    // border band get border_color composited over the fill.
+    vec2 edge = min(uv_interp, 1.0 - uv_interp) * size;
+    vec4 frag = color;
+    if (min(edge.x, edge.y) < border_width) {
+        frag.rgb = mix(frag.rgb, border_color.rgb, border_color.a);
+        frag.a = border_color.a + frag.a * (1.0 - border_color.a);
+    }
+    fragColor = frag;
+}
+"""
+
+
+# Bit flags for the per-button interaction state.
+_CLICKED = 1
+_RELEASED = 2
+_FOCUS = 4
+_DOWN = 8
+
+
+_button_shader = None
+
+
+def _get_button_shader():
+    global _button_shader
+    if _button_shader is None:
+        _button_shader = gpu.types.GPUShader(_vertex_shader, _fragment_shader)
+    return _button_shader
+
+
 class Button(Widget, HoverBehavior):
 
     def __init__(self, pos=[0., 0.], size=[100., 100.], bg_color=(0, 0, 0, 0), relative={}, border_width=1.0, border_color=(0, 0, 0, 0), hover_color=(0, 0, 0, .5), halign='left', valign='bottom', angle=0):
@@ -13,41 +67,98 @@ class Button(Widget, HoverBehavior):
         self.hover_color = hover_color
         self.border_width = border_width
         self.border_color = border_color
-        self._clicked = False
-        self._released = False
-        self._in_focus = False
-        self._down = False
+        self._state = 0
+
+    @property
+    def _clicked(self):
+        return bool(self._state & _CLICKED)
+
+    @_clicked.setter
+    def _clicked(self, val):
+        if val:
+            self._state |= _CLICKED
+        else:
+            self._state &= ~_CLICKED
+
+    @property
+    def _released(self):
+        return bool(self._state & _RELEASED)
+
+    @_released.setter
+    def _released(self, val):
+        if val:
+            self._state |= _RELEASED
+        else:
+            self._state &= ~_RELEASED
+
+    @property
+    def _in_focus(self):
+        return bool(self._state & _FOCUS)
+
+    @_in_focus.setter
+    def _in_focus(self, val):
+        if val:
+            self._state |= _FOCUS
+        else:
+            self._state &= ~_FOCUS
+
+    @property
+    def _down(self):
+        return bool(self._state & _DOWN)
+
+    @_down.setter
+    def _down(self, val):
+        if val:
+            self._state |= _DOWN
+        else:
+            self._state &= ~_DOWN
+
+    def build_shader(self):
+        super().build_shader()
+        if self.parent is None:
+            return
+        self._shader = _get_button_shader()
+        self._batch = batch_for_shader(
+            self._shader, 'TRIS',
+            {
+                "pos": self._vertices,
+                "uv": ((0, 0), (1, 0), (1, 1), (0, 1)),
+            },
+            indices=((0, 1, 2), (2, 3, 0))
+        )
 
     def draw(self):
         super()._setup_draw()
+        canvas = self.canvas
+        state = self._state & ~(_CLICKED | _RELEASED)
         if self.hover:
-            self._in_focus = True
+            self._state = state | _FOCUS
             self.on_hover(self)
-            self.canvas._hover_consumed = True
+            canvas._hover_consumed = True
         else:
-            self._in_focus = False
-
-        self._released = False
-        self._clicked = False
-        gpu.state.line_width_set(self.border_width)
-        gpu.state.point_size_set(self.border_width)
-        self._shader.uniform_float("color", self.hover_color if self._in_focus else self.bg_color)
-        self._batch.draw(self._shader)
-        self._shader.uniform_float("color", self.border_color)
-        self._batch_line.draw(self._shader)
-        self._batch_points.draw(self._shader)
+            self._state = state & ~_FOCUS
+        state = self._state
+        fill_color = self.hover_color if state & _FOCUS else self.bg_color
+        border = self.border_width and self.border_color[3]
+        if fill_color[3] or border:
+            shader = self._shader
+            shader.bind()
+            shader.uniform_float("color", fill_color)
+            shader.uniform_float("border_color", self.border_color)
+            shader.uniform_float("border_width", self.border_width if border else 0.0)
+            shader.uniform_float("size", self._draw_size)
+            self._batch.draw(shader)
         super().draw()
-        if self._in_focus and MOUSE_EVENTS[LMB].active and not self.canvas._click_consumed:
+        lmb_active = canvas._lmb_active
+        if state & _FOCUS and lmb_active and not canvas._click_consumed:
             self.on_click(self)
-            self._clicked = True
-            self.canvas._click_consumed = True
-            self._down = True
-        elif not MOUSE_EVENTS[LMB].active and self._down:
+            self._state |= _CLICKED | _DOWN
+            canvas._click_consumed = True
+        elif not lmb_active and state & _DOWN:
             self.on_release(self)
-            self._down = False
-            self._released = True
-            self.canvas._click_consumed = False
-        elif self._down:
+            self._state = (self._state | _RELEASED) & ~_DOWN
+            canvas._click_consumed = False
+        elif state & _DOWN:
             self.on_hold(self)
 
     def on_click(self, widget):
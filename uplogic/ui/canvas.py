@@ -1,5 +1,6 @@
 from .widget import Widget
 from bge import render
+from uplogic.input.mouse import MOUSE_EVENTS, LMB
 import gpu
 import bge
 
@@ -10,6 +11,7 @@ class Canvas(Widget):
         super().__init__((0, 0), (0, 0))
         self._hover_consumed = False
         self._click_consumed = False
+        self._lmb_active = False
         self.use_clipping = False
         self._to_evaluate = []
         bge.logic.getCurrentScene().post_draw.append(self.draw)
@@ -50,6 +52,9 @@ class Canvas(Widget):
     def draw(self):
         if not self.show:
             return
+        # Snapshot the mouse button once so every widget in this pass reads
+        # a plain attribute instead of the event dict.
+        self._lmb_active = MOUSE_EVENTS[LMB].active
         gpu.state.blend_set('ALPHA')
         super().draw()
         self._hover_consumed = False
@@ -1,14 +1,42 @@
 from .widget import Widget
 from uplogic.input import MOUSE
 import gpu
-import bge, bpy
-from gpu_extras.batch import batch_for_shader
+import bge
 from bge import logic
 
 
 CURSOR = None
 
 
+_vertex_shader = """
+uniform vec2 mouse_px;
+uniform vec2 size;
+uniform vec2 screen;
+in vec2 pos;
+in vec2 texCoord;
+out vec2 uv;
+
+void main()
+{
+    uv = texCoord;
+    vec2 px = pos * size + mouse_px;
+    gl_Position = vec4(px / screen * 2.0 - 1.0, 0.0, 1.0);
+}
+"""
+
+
+_fragment_shader = """
+uniform sampler2D image;
+in vec2 uv;
+out vec4 fragColor;
+
+void main()
+{
+    fragColor = texture(image, uv);
+}
+"""
+
+
 def remove_custom_cursor():
     scene = bge.logic.getCurrentScene()
     to_remove = []
@@ -26,11 +54,11 @@ class Cursor(Widget):
         remove_custom_cursor()
         super().__init__(MOUSE.position, size)
         self._texture = None
-        self._shader = None
         self.texture = texture
         self.pos = MOUSE.position
         self._last_visible = logic.mouse.visible
-        bge.logic.getCurrentScene().post_draw.append(self._draw_custom_cursor)
+        self._post_draw = bge.logic.getCurrentScene().post_draw
+        self._post_draw.append(self._draw_custom_cursor)
 
     @property
     def texture(self):
@@ -38,36 +66,45 @@ class Cursor(Widget):
 
     @texture.setter
     def texture(self, val):
+        import bpy
         texture = bpy.data.images.get(val)
         if texture:
             self._texture = gpu.texture.from_image(texture)
 
     def build_shader(self):
-        self._shader = gpu.shader.from_builtin('2D_IMAGE')
-        screen_res = [bge.render.getWindowWidth(), bge.render.getWindowHeight()]
-        mpos = [MOUSE.position.x * screen_res[0] + self.offset[0], (1 - MOUSE.position.y) * screen_res[1] + self.offset[1]]
+        from gpu_extras.batch import batch_for_shader
+        # Static unit quad anchored at the hotspot; the vertex stage moves it
+        # to the mouse position, so the batch is only built once.
+        self._shader = gpu.types.GPUShader(_vertex_shader, _fragment_shader)
         self._batch = batch_for_shader(
             self._shader, 'TRI_FAN',
             {
-                "pos": (
-                    (mpos[0], mpos[1] - self.size[1]),
-                    (mpos[0] + self.size[0], mpos[1] - self.size[1]),
-                    (mpos[0] + self.size[0], mpos[1]),
-                    mpos
-                ),
+                "pos": ((0, -1), (1, -1), (1, 0), (0, 0)),
                 "texCoord": ((0, 0), (1, 0), (1, 1), (0, 1)),
             },
         )
 
     def _draw_custom_cursor(self):
-        self.build_shader()
-        scene = bge.logic.getCurrentScene()
-        if scene.post_draw[-1] is not self._draw_custom_cursor:
-            scene.post_draw.remove(self._draw_custom_cursor)
-            scene.post_draw.append(self._draw_custom_cursor)
+        # The O(n) remove only runs when another callback was appended after
+        # this one; the steady-state cost is the tail identity check.
+        post_draw = self._post_draw
+        if post_draw[-1] is not self._draw_custom_cursor:
+            post_draw.remove(self._draw_custom_cursor)
+            post_draw.append(self._draw_custom_cursor)
         gpu.state.blend_set('ALPHA')
         if self.show:
             self.pos = MOUSE.position
-            self._shader.bind()
-            self._shader.uniform_sampler("image", self.texture)
-            self._batch.draw(self._shader)
+            screen_res = (bge.render.getWindowWidth(), bge.render.getWindowHeight())
+            shader = self._shader
+            if shader is None:
+                self.build_shader()
+                shader = self._shader
+            shader.bind()
+            shader.uniform_float("mouse_px", (
+                MOUSE.position.x * screen_res[0] + self.offset[0],
+                (1 - MOUSE.position.y) * screen_res[1] + self.offset[1]
+            ))
+            shader.uniform_float("screen", screen_res)
+            shader.uniform_float("size", self.size)
+            shader.uniform_sampler("image", self.texture)
+            self._batch.draw(shader)
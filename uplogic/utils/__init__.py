@@ -23,6 +23,7 @@ from .raycasting import raycast_camera  # noqa
 from .raycasting import raycast_face  # noqa
 from .raycasting import raycast_projectile  # noqa
 from .raycasting import raycast_mouse  # noqa
+from .raycasting import make_raycaster  # noqa
 from .scene import set_scene  # noqa
 from .pooling import SpawnPool  # noqa
 from .pooling import Spawn  # noqa
@@ -53,6 +54,7 @@ from .objects import xrot_to
 from .objects import yrot_to
 from .objects import zrot_to
 from .objects import rotate_to
+from .objects import rot_to_batch
 from .constants import STATUS_INVALID
 from .constants import STATUS_WAITING
 from .constants import STATUS_READY
@@ -156,8 +158,9 @@ def is_invalid(*a) -> bool:
 
 
 def is_waiting(*args) -> bool:
-    if STATUS_WAITING in args:
-        return True
+    for arg in args:
+        if arg is STATUS_WAITING:
+            return True
     return False
 
 
@@ -0,0 +1,121 @@
+'''AABB broadphase helpers for raycasting.
+
+The tree built here only answers "could a ray hit anything" by wrapping
+each scene object in its world-space bounding box; exact hits still go
+through the physics `rayCast`. Trees are cached per scene and are not
+tracked against object movement — call `invalidate` after objects move,
+or leave the broadphase disabled for dynamic scenes.
+'''
+from mathutils import Vector
+
+
+_scene_trees = {}
+_object_trees = {}
+
+# Quads over Blender's bound_box corner ordering; winding is irrelevant
+# for a boolean overlap query.
+_BOX_FACES = (
+    (0, 1, 2, 3),
+    (4, 7, 6, 5),
+    (0, 4, 5, 1),
+    (1, 5, 6, 2),
+    (2, 6, 7, 3),
+    (3, 7, 4, 0)
+)
+
+
+def _world_aabb(obj):
+    """Get the world space bounding box corners of a game object.\n
+    Not intended for manual use.
+    """
+    bound_box = getattr(obj.blenderObject, 'bound_box', None)
+    if bound_box is None:
+        return None
+    mat = obj.worldTransform
+    return [mat @ Vector(corner) for corner in bound_box]
+
+
+def build_scene_bvh(scene):
+    """Build a `BVHTree` over the world bounding boxes of all objects in a
+    scene. Returns `None` when the scene holds no boxable geometry.
+
+    :param `scene`: the `KX_Scene` to wrap.
+    """
+    from mathutils.bvhtree import BVHTree
+    verts = []
+    faces = []
+    for obj in scene.objects:
+        corners = _world_aabb(obj)
+        if corners is None:
+            continue
+        offset = len(verts)
+        verts.extend(corners)
+        faces.extend(
+            tuple(offset + i for i in face) for face in _BOX_FACES
+        )
+    if not faces:
+        return None
+    return BVHTree.FromPolygons(verts, faces)
+
+
+def box_tree(min_co, max_co):
+    """Build a single-box `BVHTree` spanning the given bounds, suitable for
+    `overlap` queries against a scene tree.
+
+    :param `min_co`: lower corner; any vector or list.
+    :param `max_co`: upper corner; any vector or list.
+    """
+    from mathutils.bvhtree import BVHTree
+    x0, y0, z0 = min_co
+    x1, y1, z1 = max_co
+    verts = [
+        (x0, y0, z0), (x0, y0, z1), (x0, y1, z1), (x0, y1, z0),
+        (x1, y0, z0), (x1, y0, z1), (x1, y1, z1), (x1, y1, z0)
+    ]
+    return BVHTree.FromPolygons(verts, list(_BOX_FACES))
+
+
+def get_scene_bvh(scene):
+    """Get the cached bounding box tree for a scene, building it on first
+    use.
+
+    :param `scene`: the `KX_Scene` to wrap.
+    """
+    key = id(scene)
+    if key not in _scene_trees:
+        _scene_trees[key] = build_scene_bvh(scene)
+    return _scene_trees[key]
+
+
+def bvh_for(obj):
+    """Get a cached local space `BVHTree` of a game object's evaluated
+    mesh, or `None` for objects without one.
+
+    :param `obj`: the `KX_GameObject` to wrap.
+    """
+    key = id(obj)
+    if key not in _object_trees:
+        import bpy
+        from mathutils.bvhtree import BVHTree
+        try:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            _object_trees[key] = BVHTree.FromObject(
+                obj.blenderObject,
+                depsgraph
+            )
+        except Exception:
+            _object_trees[key] = None
+    return _object_trees[key]
+
+
+def invalidate(scene=None):
+    """Drop the cached trees for a scene (or all scenes when `None`) so the
+    next query rebuilds them.
+
+    :param `scene`: the `KX_Scene` whose tree to drop.
+    """
+    _object_trees.clear()
+    if scene is None:
+        _scene_trees.clear()
+    else:
+        _scene_trees.pop(id(scene), None)
@@ -0,0 +1,37 @@
+'''Optional numba-accelerated math kernels.
+
+Numba is not bundled with Blender; when it is missing the kernels run as
+plain Python functions with identical results.
+'''
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def rot_step(vx, vy, fx, fy, factor):
+    """Signed rotation step from the front axis (fx, fy) towards (vx, vy),
+    scaled by `factor` clamped to 0-1. Returns 0.0 when already aligned or
+    when either projected direction is degenerate."""
+    if vx == 0.0 and vy == 0.0:
+        return 0.0
+    if fx == 0.0 and fy == 0.0:
+        return 0.0
+    angle = math.atan2(vy, vx) - math.atan2(fy, fx)
+    if angle > math.pi:
+        angle -= 2.0 * math.pi
+    elif angle < -math.pi:
+        angle += 2.0 * math.pi
+    if -0.01 < angle < 0.01:
+        return 0.0
+    if factor < 0.0:
+        factor = 0.0
+    elif factor > 1.0:
+        factor = 1.0
+    return angle * factor
+
+
+if njit is not None:
+    rot_step = njit(cache=True, fastmath=True)(rot_step)
@@ -1,8 +1,6 @@
 from bge.types import KX_GameObject as GameObject
 from bge import logic
-from bpy.types import Object
-import bpy
-from mathutils import Vector, Matrix, Color
+from mathutils import Vector, Matrix
 
 
 def make_unique_light(light: GameObject) -> GameObject:
@@ -39,7 +37,10 @@ class ULLight():
         if light:
             self.game_object = make_unique_light(light)
             """The wrapped `KX_LightObject`."""
+            self._bobj = self.game_object.blenderObject
+            self._data = self._bobj.data
             return
+        import bpy
         game_scene = logic.getCurrentScene()
         scene = bpy.data.scenes[game_scene.name]
         light = bpy.data.lights.new(name, type)
@@ -47,99 +48,51 @@ class ULLight():
         scene.collection.objects.link(light)
         self.game_object = game_scene.convertBlenderObject(light)
         """The wrapped `KX_LightObject`."""
+        self._bobj = self.game_object.blenderObject
+        self._data = self._bobj.data
         self.energy = 10
 
-    @property
-    def blenderObject(self) -> Object:
-        return self.game_object.blenderObject
-
-    @property
-    def energy(self) -> float:
-        return self.game_object.blenderObject.data.energy
-
-    @energy.setter
-    def energy(self, val: float):
-        self.game_object.blenderObject.data.energy = val
-
-    @property
-    def color(self) -> Color:
-        return self.game_object.blenderObject.data.color
-
-    @color.setter
-    def color(self, val: Color):
-        self.game_object.blenderObject.data.color = val
-
-    @property
-    def use_shadow(self) -> bool:
-        return self.game_object.blenderObject.data.use_shadow
-
-    @use_shadow.setter
-    def use_shadow(self, val: bool):
-        self.game_object.blenderObject.data.use_shadow = val
-
-    @property
-    def shadow_clip_start(self) -> float:
-        return self.game_object.blenderObject.data.shadow_buffer_clip_start
-
-    @shadow_clip_start.setter
-    def shadow_clip_start(self, val: float):
-        self.game_object.blenderObject.data.shadow_buffer_clip_start = val
-
-    @property
-    def shadow_bias(self) -> float:
-        return self.game_object.blenderObject.data.shadow_buffer_bias
-
-    @shadow_bias.setter
-    def shadow_bias(self, val: float):
-        self.game_object.blenderObject.data.shadow_buffer_bias = val
-
-    @property
-    def use_custom_distance(self) -> bool:
-        return self.game_object.blenderObject.data.use_custom_distance
-
-    @use_custom_distance.setter
-    def use_custom_distance(self, val: bool):
-        self.game_object.blenderObject.data.use_custom_distance = val
-
-    @property
-    def distance(self) -> float:
-        return self.game_object.blenderObject.data.cutoff_distance
-
-    @distance.setter
-    def distance(self, val: float):
-        self.game_object.blenderObject.data.cutoff_distance = val
-
-    @property
-    def angle(self)-> float:
-        return self.game_object.blenderObject.data.angle
-
-    @angle.setter
-    def angle(self, val: float):
-        self.game_object.blenderObject.data.angle = val
-
-    @property
-    def spot_size(self) -> float:
-        return self.game_object.blenderObject.data.spot_size
-
-    @spot_size.setter
-    def spot_size(self, val: float):
-        self.game_object.blenderObject.data.spot_size = val
-
-    @property
-    def spot_blend(self) -> float:
-        return self.game_object.blenderObject.data.spot_blend
-
-    @spot_blend.setter
-    def spot_blend(self, val: float):
-        self.game_object.blenderObject.data.spot_blend = val
+    # Light-data attributes forwarded unchanged to the cached data block.
+    _PASS = frozenset((
+        'energy',
+        'color',
+        'use_shadow',
+        'use_custom_distance',
+        'angle',
+        'spot_size',
+        'spot_blend',
+    ))
+    # Wrapper names mapped to differently named light-data attributes.
+    _ALIAS = {
+        'radius': 'shadow_soft_size',
+        'distance': 'cutoff_distance',
+        'shadow_clip_start': 'shadow_buffer_clip_start',
+        'shadow_bias': 'shadow_buffer_bias',
+    }
+
+    def __getattr__(self, name):
+        # Only reached for names not found on the instance or class; the
+        # light-data attributes resolve against the cached data block.
+        if name in self._PASS:
+            return getattr(self._data, name)
+        alias = self._ALIAS.get(name)
+        if alias is not None:
+            return getattr(self._data, alias)
+        raise AttributeError(name)
+
+    def __setattr__(self, name, val):
+        if name in self._PASS:
+            setattr(self._data, name, val)
+            return
+        alias = self._ALIAS.get(name)
+        if alias is not None:
+            setattr(self._data, alias, val)
+            return
+        object.__setattr__(self, name, val)
 
     @property
-    def radius(self) -> float:
-        return self.game_object.blenderObject.data.shadow_soft_size
-
-    @radius.setter
-    def radius(self, val: float):
-        self.game_object.blenderObject.data.shadow_soft_size = val
+    def blenderObject(self) -> 'Object':
+        return self._bobj
 
     @property
     def parent(self) -> GameObject:
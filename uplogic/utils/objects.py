@@ -1,59 +1,52 @@
 from bge import logic
 from bge.types import KX_GameObject as GameObject
-import bpy
-from bpy.types import Material
+from mathutils import Vector
 from .errors import LogicControllerNotSupportedError
 from .constants import LO_AXIS_TO_VECTOR
-from .math import project_vector3
 from .math import clamp
+from ._math_jit import rot_step
 
 
-def xrot_to(
+# Projection plane (in axis indices) for rotations around X, Y and Z.
+_ROT_AXIS_PLANES = ((1, 2), (2, 0), (0, 1))
+
+
+def _rot_to(
+    rot_axis_index,
     rotating_object,
     target_pos,
     front_axis_code=1,
     factor=1
 ):
+    a, b = _ROT_AXIS_PLANES[rot_axis_index]
     front_vector = LO_AXIS_TO_VECTOR[front_axis_code]
     vec = rotating_object.getVectTo(target_pos)[1]
-    vec = project_vector3(vec, 1, 2)
-    vec.normalize()
     front_vector = rotating_object.getAxisVect(front_vector)
-    front_vector = project_vector3(front_vector, 1, 2)
-    signed_angle = vec.angle_signed(front_vector, None)
-    if signed_angle is None:
-        return
-    abs_angle = abs(signed_angle)
-    if abs_angle < 0.01:
+    step = rot_step(vec[a], vec[b], front_vector[a], front_vector[b], factor)
+    if step == 0.0:
         return True
-    angle_sign = (signed_angle > 0) - (signed_angle < 0)
-    drot = angle_sign * abs_angle * clamp(factor)
-    rotating_object.applyRotation((drot, 0, 0), True)
+    drot = [0, 0, 0]
+    drot[rot_axis_index] = step
+    rotating_object.applyRotation(drot, True)
     return False
 
 
+def xrot_to(
+    rotating_object,
+    target_pos,
+    front_axis_code=1,
+    factor=1
+):
+    return _rot_to(0, rotating_object, target_pos, front_axis_code, factor)
+
+
 def yrot_to(
     rotating_object,
     target_pos,
     front_axis_code=1,
     factor=1
 ):
-    front_vector = LO_AXIS_TO_VECTOR[front_axis_code]
-    vec = rotating_object.getVectTo(target_pos)[1]
-    vec = project_vector3(vec, 2, 0)
-    vec.normalize()
-    front_vector = rotating_object.getAxisVect(front_vector)
-    front_vector = project_vector3(front_vector, 2, 0)
-    signed_angle = vec.angle_signed(front_vector, None)
-    if signed_angle is None:
-        return
-    abs_angle = abs(signed_angle)
-    if abs_angle < 0.01:
-        return True
-    angle_sign = (signed_angle > 0) - (signed_angle < 0)
-    drot = angle_sign * abs_angle * clamp(factor)
-    rotating_object.applyRotation((0, drot, 0), True)
-    return False
+    return _rot_to(1, rotating_object, target_pos, front_axis_code, factor)
 
 
 def zrot_to(
@@ -62,22 +55,7 @@ def zrot_to(
     front_axis_code=1,
     factor=1
 ):
-    front_vector = LO_AXIS_TO_VECTOR[front_axis_code]
-    vec = rotating_object.getVectTo(target_pos)[1]
-    vec = project_vector3(vec, 0, 1)
-    vec.normalize()
-    front_vector = rotating_object.getAxisVect(front_vector)
-    front_vector = project_vector3(front_vector, 0, 1)
-    signed_angle = vec.angle_signed(front_vector, None)
-    if signed_angle is None:
-        return True
-    abs_angle = abs(signed_angle)
-    if abs_angle < 0.01:
-        return True
-    angle_sign = (signed_angle > 0) - (signed_angle < 0)
-    drot = angle_sign * abs_angle * clamp(factor)
-    rotating_object.applyRotation((0, 0, drot), True)
-    return False
+    return _rot_to(2, rotating_object, target_pos, front_axis_code, factor)
 
 
 def rotate_to(
@@ -87,27 +65,81 @@ def rotate_to(
     front_axis_code,
     factor=1
 ):
-    if rot_axis_index == 0:
-        return xrot_to(
-            rotating_object,
-            target_pos,
-            front_axis_code,
-            factor
-        )
-    elif rot_axis_index == 1:
-        return yrot_to(
-            rotating_object,
-            target_pos,
-            front_axis_code,
-            factor
-        )
-    elif rot_axis_index == 2:
-        return zrot_to(
-            rotating_object,
-            target_pos,
-            front_axis_code,
-            factor
-        )
+    return _rot_to(
+        rot_axis_index,
+        rotating_object,
+        target_pos,
+        front_axis_code,
+        factor
+    )
+
+
+# Scratch vector for move_to; game logic runs single-threaded, so one
+# module-level instance can be reused to avoid per-call allocations.
+_MOVE_SCRATCH = Vector((0, 0, 0))
+
+
+def rot_to_batch(
+    rotating_objects,
+    target_positions,
+    rot_axis=2,
+    front_axis_code=1,
+    factor=1
+):
+    """Rotate several objects towards their respective targets at once.
+
+    The signed-angle math for all objects is computed in one NumPy batch;
+    only the per-object `applyRotation` writes remain in Python. Use this
+    instead of calling `xrot_to`/`yrot_to`/`zrot_to` in a loop when many
+    objects steer each frame.
+
+    :param `rotating_objects`: list of `KX_GameObject`
+    :param `target_positions`: list of target points; any vectors or lists.
+    :param `rot_axis`: index of the axis to rotate around (0=X, 1=Y, 2=Z).
+    :param `front_axis_code`: code of the axis facing the target.
+    :param `factor`: rotation speed from 0-1.
+
+    :returns: list of `bool`; `True` for objects already facing their target.
+    """
+    import numpy as np
+    if not rotating_objects:
+        return []
+    a, b = _ROT_AXIS_PLANES[rot_axis]
+    fac = clamp(factor)
+    front_vector = LO_AXIS_TO_VECTOR[front_axis_code]
+    pos = np.array(
+        [obj.worldPosition for obj in rotating_objects],
+        dtype=float
+    )
+    tgt = np.array(
+        [getattr(t, 'worldPosition', t) for t in target_positions],
+        dtype=float
+    )
+    front = np.array(
+        [obj.getAxisVect(front_vector) for obj in rotating_objects],
+        dtype=float
+    )
+    diff = tgt - pos
+    angles = (
+        np.arctan2(diff[:, b], diff[:, a]) -
+        np.arctan2(front[:, b], front[:, a])
+    )
+    # Wrap to [-pi, pi] so every object takes the short way around.
+    angles = (angles + np.pi) % (2 * np.pi) - np.pi
+    # Degenerate projections (target on the rotation axis or at the
+    # object's own position) get no step, matching rot_step.
+    degenerate = (
+        ((diff[:, a] == 0) & (diff[:, b] == 0)) |
+        ((front[:, a] == 0) & (front[:, b] == 0))
+    )
+    done = (np.abs(angles) < 0.01) | degenerate
+    drot = [0.0, 0.0, 0.0]
+    for i, obj in enumerate(rotating_objects):
+        if done[i]:
+            continue
+        drot[rot_axis] = angles[i] * fac
+        obj.applyRotation(drot, True)
+    return done.tolist()
 
 
 def move_to(
@@ -118,34 +150,53 @@ def move_to(
     dynamic,
     distance
 ):
+    direction = _MOVE_SCRATCH
+    direction[:] = destination_point
+    direction -= moving_object.worldPosition
+    dst = direction.length
+    if dst <= distance:
+        return True
     if dynamic:
-        direction = (
-            destination_point -
-            moving_object.worldPosition)
-        dst = direction.length
-        if(dst <= distance):
-            return True
         direction.z = 0
         direction.normalize()
-        velocity = direction * speed
-        velocity.z = moving_object.worldLinearVelocity.z
-        moving_object.worldLinearVelocity = velocity
+        direction *= speed
+        direction.z = moving_object.worldLinearVelocity.z
+        moving_object.worldLinearVelocity = direction
         return False
     else:
-        direction = (
-            destination_point -
-            moving_object.worldPosition
-            )
-        dst = direction.length
-        if(dst <= distance):
-            return True
         direction.normalize()
-        displacement = speed * time_per_frame
-        motion = direction * displacement
-        moving_object.worldPosition += motion
+        direction *= speed * time_per_frame
+        moving_object.worldPosition += direction
         return False
 
 
+# Reducers deriving each controller logic mode from the sensor and
+# positive counts; one hash lookup replaces a chain of string compares.
+_LOGIC_REDUCERS = {
+    'LOGIC_AND': lambda total, positive: positive == total,
+    'LOGIC_OR': lambda total, positive: positive > 0,
+    'LOGIC_NAND': lambda total, positive: positive < total,
+    'LOGIC_NOR': lambda total, positive: positive == 0,
+    'LOGIC_XOR': lambda total, positive: positive % 2 != 0,
+    'LOGIC_XNOR': lambda total, positive: positive == 0 or positive == total,
+}
+
+
+def _controller_positive(state, sensors):
+    """Evaluate a logic brick controller state in a single pass over its
+    sensors."""
+    reducer = _LOGIC_REDUCERS.get(state)
+    if reducer is None:
+        raise LogicControllerNotSupportedError
+    total = 0
+    positive = 0
+    for sens in sensors:
+        total += 1
+        if sens.positive:
+            positive += 1
+    return reducer(total, positive)
+
+
 def controller_brick_status(owner, controller_name):
     cont = owner.controllers[controller_name]
     state = (
@@ -157,52 +208,22 @@ def controller_brick_status(owner, controller_name):
     )
     if not cont.sensors:
         return False
-    elif state == 'LOGIC_AND':
-        return False not in [sens.positive for sens in cont.sensors]
-    elif state == 'LOGIC_OR':
-        return True in [sens.positive for sens in cont.sensors]
-    elif state == 'LOGIC_NAND':
-        return False in [sens.positive for sens in cont.sensors]
-    elif state == 'LOGIC_NOR':
-        return True not in [sens.positive for sens in cont.sensors]
-    elif state == 'LOGIC_XOR':
-        return [
-            sens.positive
-            for sens in
-            cont.sensors
-        ].count(True) % 2 != 0
-    elif state == 'LOGIC_XNOR':
-        check = cont.sensors[0].positive
-        return False not in [
-            sens.positive == check
-            for sens in
-            cont.sensors
-        ]
-    else:
-        raise LogicControllerNotSupportedError
+    return _controller_positive(state, cont.sensors)
 
 
-class ControllerBrick(tuple):
+class ControllerBrick:
 
-    @property
-    def brick(self):
-        return self[0]
+    __slots__ = ('brick', 'positive', 'sensors', 'actuators')
 
-    @property
-    def name(self):
-        return self[0].name
-
-    @property
-    def positive(self):
-        return self[1]
-
-    @property
-    def sensors(self):
-        return self[2]
+    def __init__(self, brick, positive, sensors, actuators):
+        self.brick = brick
+        self.positive = positive
+        self.sensors = sensors
+        self.actuators = actuators
 
     @property
-    def actuators(self):
-        return self[3]
+    def name(self):
+        return self.brick.name
 
 
 def controller_brick(owner, controller_name):
@@ -215,37 +236,20 @@ def controller_brick(owner, controller_name):
         .type
     )
     if not cont.sensors:
-        return ControllerBrick([cont, False, cont.sensors, cont.actuators])
-    elif state == 'LOGIC_AND':
-        return ControllerBrick([cont, False not in [sens.positive for sens in cont.sensors], cont.sensors, cont.actuators])
-    elif state == 'LOGIC_OR':
-        return ControllerBrick([cont, True in [sens.positive for sens in cont.sensors], cont.sensors, cont.actuators])
-    elif state == 'LOGIC_NAND':
-        return ControllerBrick([cont, False in [sens.positive for sens in cont.sensors], cont.sensors, cont.actuators])
-    elif state == 'LOGIC_NOR':
-        return ControllerBrick([cont, True not in [sens.positive for sens in cont.sensors], cont.sensors, cont.actuators])
-    elif state == 'LOGIC_XOR':
-        return ControllerBrick([cont, [
-            sens.positive
-            for sens in
-            cont.sensors
-        ].count(True) % 2 != 0, cont.sensors, cont.actuators])
-    elif state == 'LOGIC_XNOR':
-        check = cont.sensors[0].positive
-        return ControllerBrick([cont, False not in [
-            sens.positive == check
-            for sens in
-            cont.sensors
-        ], cont.sensors, cont.actuators])
-    else:
-        raise LogicControllerNotSupportedError
+        return ControllerBrick(cont, False, cont.sensors, cont.actuators)
+    return ControllerBrick(
+        cont,
+        _controller_positive(state, cont.sensors),
+        cont.sensors,
+        cont.actuators
+    )
 
 
 def create_curve(
     name: str,
     bevel_depth: float = 0.0,
     dimensions: int = 3,
-    material: str or Material = None,
+    material: 'str or Material' = None,
     collection: str = None
 ) -> GameObject:
     """Create a `KX_GameObject` containing a `bpy.types.Curve` object.
@@ -259,6 +263,8 @@ def create_curve(
     :param `collection`: The collection to which to add the curve. Leave at
     `None` to use scene collection.
     """
+    import bpy
+    from bpy.types import Material
     bcurve = bpy.data.curves.new(name, 'CURVE')
     bcurve.bevel_depth = bevel_depth
     bcurve.dimensions = f'{dimensions}D'
@@ -288,18 +294,36 @@ def set_curve_points(
     :param `points`: A list of points to use for the curve.
     """
     bcurve = curve.blenderObject.data
-    for spline in bcurve.splines:
-        bcurve.splines.remove(spline)
-    spline = bcurve.splines.new('POLY')
-    pos = curve.worldPosition
-
+    splines = bcurve.splines
+    if (
+        len(splines) == 1 and
+        splines[0].type == 'POLY' and
+        len(splines[0].points) == len(points)
+    ):
+        # Same topology: overwrite the coordinates in place instead of
+        # rebuilding the spline (which churns RNA and re-bevels).
+        _fill_spline_points(splines[0].points, points, curve.worldPosition)
+        # foreach_set skips RNA update callbacks, so tag the curve for
+        # depsgraph re-evaluation; the rebuild path below tags through
+        # its structural calls.
+        bcurve.update_tag()
+        return
+    for spline in list(splines):
+        splines.remove(spline)
+    spline = splines.new('POLY')
     spline.points.add(len(points)-1)
-    for p, new_co in zip(spline.points, points):
-        p.co = ([
-            new_co[0] - pos.x,
-            new_co[1] - pos.y,
-            new_co[2] - pos.z
-        ] + [1.0])
+    _fill_spline_points(spline.points, points, curve.worldPosition)
+
+
+def _fill_spline_points(spline_points, points, pos):
+    import numpy as np
+    coords = np.empty((len(points), 4), dtype=np.float32)
+    coords[:, :3] = np.asarray(points, dtype=np.float32)
+    coords[:, 0] -= pos.x
+    coords[:, 1] -= pos.y
+    coords[:, 2] -= pos.z
+    coords[:, 3] = 1.0
+    spline_points.foreach_set('co', coords.ravel())
 
 
 class ULCurve():
@@ -322,7 +346,7 @@ class ULCurve():
         name: str,
         bevel_depth: float = 0.0,
         dimensions: int = 3,
-        material: str or Material =None,
+        material: 'str or Material' = None,
         collection: str = None
     ) -> None:
         if self._deprecated:
@@ -334,6 +358,7 @@ class ULCurve():
             material,
             collection
         )
+        self._data = self.object.blenderObject.data
 
     @property
     def name(self):
@@ -347,22 +372,23 @@ class ULCurve():
     @property
     def points(self):
         """Points of the curve. These points use global coordinates."""
-        splines = self.object.blenderObject.data.splines
+        splines = self._data.splines
         return splines[0].points if len(splines) > 0 else []
 
     @points.setter
     def points(self, val):
-        if val != self.points:
-            set_curve_points(self.object, val)
+        # Comparing val against the bpy point collection never detected
+        # equality; updates are cheap now, so always write them through.
+        set_curve_points(self.object, val)
 
     @property
     def bevel_depth(self):
         """Thickness of the curve geometry."""
-        return self.object.blenderObject.data.bevel_depth
+        return self._data.bevel_depth
 
     @bevel_depth.setter
     def bevel_depth(self, val):
-        self.object.blenderObject.data.bevel_depth = val
+        self._data.bevel_depth = val
 
 
 class Curve(ULCurve):
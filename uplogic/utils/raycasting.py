@@ -2,9 +2,57 @@ from bge import logic
 from bge import render
 from bge.types import KX_GameObject as GameObject
 from bge.types import KX_PolyProxy
+from functools import lru_cache
 from mathutils import Vector
 
 
+# Opt-in mesh BVH path for raycast_camera/raycast_mouse. Off by default
+# for the same reason as the projectile broadphase: the cached trees do
+# not follow moving geometry. Only enable for static scenes.
+STATIC_SCENE = False
+
+# Opt-in AABB broadphase for raycast_projectile. Off by default: the
+# cached tree is not tracked against object movement, so only enable it
+# for (mostly) static scenes and call `_bvh.invalidate` after changes.
+PROJECTILE_BROADPHASE = False
+
+@lru_cache(maxsize=256)
+def _slot_names(key, bo) -> frozenset:
+    """Get the material slot names of a blender object; `key` is `id(bo)`
+    to keep recreated RNA wrappers from colliding.\n
+    Not intended for manual use.
+    """
+    return frozenset(
+        slot.material.name for slot in bo.material_slots
+    )
+
+
+def _ensure_slot_flush():
+    """Register a once-per-frame flush of the slot-name cache so material
+    edits do not go stale. Done lazily on the first raycast; no scene
+    exists at import time. The membership check keeps each scene's
+    pre_draw list at one callback, whichever scene is casting.\n
+    Not intended for manual use.
+    """
+    scene = logic.getCurrentScene()
+    if _slot_names.cache_clear not in scene.pre_draw:
+        scene.pre_draw.append(_slot_names.cache_clear)
+        _slot_names.cache_clear()
+
+
+def _to_world(value) -> Vector:
+    """Coerce a game object, vector or list to a world space `Vector`.
+    The result may alias the input; callers only read it.\n
+    Not intended for manual use.
+    """
+    pos = getattr(value, 'worldPosition', None)
+    if pos is not None:
+        return pos
+    if isinstance(value, Vector):
+        return value
+    return Vector(value)
+
+
 def ray_data(
     origin: Vector,
     dest: Vector,
@@ -19,10 +67,231 @@ def ray_data(
     if local:
         dest = origin + dest
     d = dest - origin
-    d.normalize()
-    dist = dist if dist else (origin - dest).length
-    dest = origin + d * dist
-    return d, dist, dest
+    length = d.length
+    if length < 1e-7:
+        # Degenerate ray; the zero distance lets callers skip the physics
+        # query instead of sweeping the scene with a zero direction.
+        return Vector((0.0, 0.0, 0.0)), 0.0, origin.copy()
+    d *= 1.0 / length
+    dist = dist if dist else length
+    # Build the endpoint in one constructor call; origin + d * dist
+    # would allocate an extra intermediate Vector.
+    end = Vector((
+        origin.x + d.x * dist,
+        origin.y + d.y * dist,
+        origin.z + d.z * dist
+    ))
+    return d, dist, end
+
+
+def _exclude_mismatch(obj, bo, material, exclude_prop):
+    """Whether a hit object should be skipped with `exclude` enabled.\n
+    Not intended for manual use.
+    """
+    return material in _slot_names(id(bo), bo) or exclude_prop in obj
+
+
+def _include_mismatch(obj, bo, material, exclude_prop):
+    """Whether a hit object should be skipped with `exclude` disabled.\n
+    Not intended for manual use.
+    """
+    return material not in _slot_names(id(bo), bo)
+
+
+def _xray_walk(
+    obj,
+    point,
+    normal,
+    face,
+    uv,
+    dest,
+    leftover_dist,
+    prop,
+    xray,
+    material,
+    exclude_prop,
+    mismatch,
+    poly
+):
+    """Skip filtered hits along a ray until one matches or the distance
+    budget runs out; shared by `raycast` and `raycast_face`.\n
+    Not intended for manual use.
+    """
+    bo = obj.blenderObject
+    while (
+        mismatch(obj, bo, material, exclude_prop)
+        and leftover_dist > 0
+    ):
+        if not xray:
+            obj, point, normal = None, None, None
+            break
+        elif point:
+            prev_point = point
+            if poly:
+                obj, point, normal, face, uv = obj.rayCast(
+                    dest,
+                    point,
+                    leftover_dist,
+                    prop,
+                    xray=xray,
+                    poly=poly
+                )
+            else:
+                obj, point, normal = obj.rayCast(
+                    dest,
+                    point,
+                    leftover_dist,
+                    prop,
+                    xray=xray
+                )
+            if not obj:
+                break
+            bo = obj.blenderObject
+            leftover_dist -= (point - prev_point).length
+        else:
+            obj, point, normal = None, None, None
+            break
+    return obj, point, normal, face, uv
+
+
+def _bvh_raycast(scene, origin, target, distance):
+    """Cast a ray against cached per-object mesh BVH trees instead of the
+    physics broadphase; only correct while objects stand still.\n
+    Not intended for manual use.
+    """
+    from ._bvh import bvh_for
+    direction = target - origin
+    length = direction.length
+    if not length:
+        return None, None, None
+    direction *= 1.0 / length
+    best = None
+    best_dist = distance if distance else length
+    for obj in scene.objects:
+        if not obj.meshes:
+            continue
+        tree = bvh_for(obj)
+        if tree is None:
+            continue
+        # The trees live in object space; transform the ray per query so
+        # the cache survives (static) transforms.
+        inv = obj.worldTransform.inverted()
+        local_origin = inv @ origin
+        local_dir = inv.to_3x3() @ direction
+        scale = local_dir.length
+        if not scale:
+            continue
+        local_dir *= 1.0 / scale
+        location, normal, _, _ = tree.ray_cast(
+            local_origin,
+            local_dir,
+            best_dist * scale
+        )
+        if location is None:
+            continue
+        mat = obj.worldTransform
+        point = mat @ location
+        hit_dist = (point - origin).length
+        if hit_dist <= best_dist:
+            best_dist = hit_dist
+            best = (obj, point, (mat.to_3x3() @ normal).normalized())
+    if best is None:
+        return None, None, None
+    return best
+
+
+def _draw_ray(origin, direction, distance, obj, point):
+    """Draw a ray line; green up to the hit point, red when nothing was
+    hit.\n
+    Not intended for manual use.
+    """
+    if obj:
+        render.drawLine(origin, point, [0, 1, 0, 1])
+    else:
+        render.drawLine(origin, origin + direction * distance, [1, 0, 0, 1])
+
+
+def _raycast_impl(
+    caster,
+    origin,
+    dest,
+    distance,
+    prop,
+    material,
+    exclude,
+    xray,
+    local,
+    mask,
+    visualize,
+    poly
+):
+    """Shared implementation behind `raycast` and `raycast_face`; returns
+    the full `(obj, point, normal, direction, face, uv)` tuple.\n
+    Not intended for manual use.
+    """
+    exclude_prop = ''
+    if exclude:
+        exclude_prop, prop = prop, ''
+    if material or exclude:
+        _ensure_slot_flush()
+    origin = _to_world(origin)
+    dest = _to_world(dest)
+    direction, distance, dest = ray_data(origin, dest, local, distance)
+    if not distance:
+        return None, None, None, direction, None, None
+    face = uv = None
+    if poly:
+        obj, point, normal, face, uv = caster.rayCast(
+            dest,
+            origin,
+            distance,
+            prop,
+            xray=xray,
+            poly=poly,
+            mask=mask
+        )
+    else:
+        obj, point, normal = caster.rayCast(
+            dest,
+            origin,
+            distance,
+            prop,
+            xray=xray,
+            mask=mask
+        )
+    if (material and point) or (obj and exclude and exclude_prop in obj):
+        # The relevant mismatch test is picked once; `exclude` is
+        # loop-invariant.
+        mismatch = _exclude_mismatch if exclude else _include_mismatch
+        leftover_dist = distance - (origin - point).length
+        if not xray:
+            # A ray that cannot pass through objects ends at the first
+            # hit; one predicate check decides the result without any
+            # walk setup.
+            if (
+                leftover_dist > 0 and
+                mismatch(obj, obj.blenderObject, material, exclude_prop)
+            ):
+                obj, point, normal = None, None, None
+        else:
+            obj, point, normal, face, uv = _xray_walk(
+                obj,
+                point,
+                normal,
+                face,
+                uv,
+                dest,
+                leftover_dist,
+                prop,
+                xray,
+                material,
+                exclude_prop,
+                mismatch,
+                poly
+            )
+    if visualize:
+        _draw_ray(origin, direction, distance, obj, point)
+    return obj, point, normal, direction, face, uv
 
 
 class RayCastData(tuple):
@@ -73,73 +342,95 @@ def raycast(
 
     :returns: (`obj`, `point`, `normal`, `direction`)
     """
-    if exclude:
-        exclude_prop, prop = prop, ''
-    origin = getattr(origin, 'worldPosition', Vector(origin)).copy()
-    dest = getattr(dest, 'worldPosition', Vector(dest)).copy()
-    direction, distance, dest = ray_data(origin, dest, local, distance)
-    obj, point, normal = caster.rayCast(
-        dest,
-        origin,
-        distance,
-        prop,
-        xray=xray,
-        mask=mask
+    return RayCastData(
+        _raycast_impl(
+            caster,
+            origin,
+            dest,
+            distance,
+            prop,
+            material,
+            exclude,
+            xray,
+            local,
+            mask,
+            visualize,
+            0
+        )[:4]
     )
-    if (material and point) or (obj and exclude and exclude_prop in obj):
-        bo = obj.blenderObject
-        leftover_dist = distance - (origin - point).length
-        while (
-            material in [
-                slot.material.name for
-                slot in
-                bo.material_slots
-            ] or exclude_prop in obj.getPropertyNames() if exclude else
-            material not in [
-                slot.material.name for
-                slot in
-                bo.material_slots
-            ]
-        ) and leftover_dist > 0:
-            if not xray:
-                obj, point, normal = None, None, None
-                break
-            elif point:
-                old_point = point
-                obj, point, normal = obj.rayCast(
-                    dest,
-                    point,
-                    leftover_dist,
-                    prop,
-                    xray=xray
-                )
-                if not obj:
-                    break
-                bo = obj.blenderObject
-                leftover_dist -= (origin - old_point).length
-            else:
-                obj, point, normal = None, None, None
-                break
 
-    if visualize:
-        line_dest: Vector = direction.copy()
-        line_dest.x *= distance
-        line_dest.y *= distance
-        line_dest.z *= distance
-        line_dest = line_dest + origin
-        if not obj:
-            render.drawLine(
+
+_raycaster_cache = {}
+
+
+def make_raycaster(
+    *,
+    distance: float = 0,
+    prop: str = '',
+    material: str = '',
+    exclude: bool = False,
+    xray: bool = False,
+    local: bool = False,
+    mask: int = 65535,
+    visualize: bool = False
+):
+    """Build a raycast callable with these settings baked in.
+
+    The returned function takes `(caster, origin, dest)` and behaves like
+    `raycast` with the given keyword settings. Without material filtering
+    or visualization the body skips every flag branch; callers firing the
+    same ray shape every frame avoid re-deciding them per call. Factories
+    are cached per settings tuple.
+
+    :param `distance`: distance the ray will be cast
+    (0 means the ray will only be cast to target).
+    :param `prop`: look only for objects with this property.
+    :param `material`: look only for objects with this material applied.
+    :param `exclude`: invert the selection for `prop` and `material`.
+    :param `xray`: look for objects behind others.
+    :param `local`: add the target vector to the origin.
+    :param `mask`: Collision Mask for this ray.
+    :param `visualize`: show the raycast.
+
+    :returns: callable `(caster, origin, dest) -> RayCastData`
+    """
+    key = (distance, prop, material, exclude, xray, local, mask, visualize)
+    caster_fn = _raycaster_cache.get(key)
+    if caster_fn is not None:
+        return caster_fn
+    if not material and not exclude and not visualize:
+        def caster_fn(caster, origin, dest):
+            origin = _to_world(origin)
+            dest = _to_world(dest)
+            direction, dist, dest = ray_data(origin, dest, local, distance)
+            if not dist:
+                return RayCastData((None, None, None, direction))
+            obj, point, normal = caster.rayCast(
+                dest,
                 origin,
-                line_dest,
-                [1, 0, 0, 1]
+                dist,
+                prop,
+                xray=xray,
+                mask=mask
             )
-        else:
-            render.drawLine(
+            return RayCastData((obj, point, normal, direction))
+    else:
+        def caster_fn(caster, origin, dest):
+            return raycast(
+                caster,
                 origin,
-                point,
-                [0, 1, 0, 1]
+                dest,
+                distance,
+                prop,
+                material,
+                exclude,
+                xray,
+                local,
+                mask,
+                visualize
             )
-    return RayCastData((obj, point, normal, direction))
+    _raycaster_cache[key] = caster_fn
+    return caster_fn
 
 
 class RayCastFaceData(RayCastData):
@@ -182,74 +473,22 @@ def raycast_face(
 
     :returns: (`obj`, `point`, `normal`, `direction`, `face`, `uv`)
     """
-    if exclude:
-        exclude_prop, prop = prop, ''
-    direction, distance, dest = ray_data(origin, dest, local, distance)
-    origin = getattr(origin, 'worldPosition', origin)
-    obj, point, normal, face, uv = caster.rayCast(
-        dest,
-        origin,
-        distance,
-        prop,
-        xray=xray,
-        poly=2,
-        mask=mask
+    return RayCastFaceData(
+        _raycast_impl(
+            caster,
+            origin,
+            dest,
+            distance,
+            prop,
+            material,
+            exclude,
+            xray,
+            local,
+            mask,
+            visualize,
+            2
+        )
     )
-    if (material and point) or (obj and exclude):
-        bo = obj.blenderObject
-        leftover_dist = distance - (origin - point).length
-        while (
-            material in [
-                slot.material.name for
-                slot in
-                bo.material_slots
-            ] or exclude_prop in obj.getPropertyNames() if exclude else
-            material not in [
-                slot.material.name for
-                slot in
-                bo.material_slots
-            ]
-        ) and leftover_dist > 0:
-            if not xray:
-                obj, point, normal = None, None, None
-                break
-            elif point:
-                old_point = point
-                obj, point, normal, face, uv = obj.rayCast(
-                    dest,
-                    point,
-                    leftover_dist,
-                    prop,
-                    xray=xray,
-                    poly=2
-                )
-                if not obj:
-                    break
-                bo = obj.blenderObject
-                leftover_dist -= (origin - old_point).length
-            else:
-                obj, point, normal = None, None, None
-                break
-
-    if visualize:
-        line_dest: Vector = direction.copy()
-        line_dest.x *= distance
-        line_dest.y *= distance
-        line_dest.z *= distance
-        line_dest = line_dest + origin
-        if not obj:
-            render.drawLine(
-                origin,
-                line_dest,
-                [1, 0, 0, 1]
-            )
-        else:
-            render.drawLine(
-                origin,
-                point,
-                [0, 1, 0, 1]
-            )
-    return RayCastFaceData((obj, point, normal, direction, face, uv))
 
 
 class RayCastProjectileData(tuple):
@@ -308,45 +547,121 @@ def raycast_projectile(
 
     :returns: (`obj`, `point`, `normal`, `points`)
     """
-    def calc_projectile(t, vel, pos, gravity):
-        half: float = gravity * (.5 * t * t)
-        vel = vel * t
-        return half + vel + pos
-
+    import numpy as np
+    from math import sqrt
+    origin = getattr(origin, 'worldPosition', origin)
     if not local:
         aim = aim - origin
-    aim.normalize()
-    aim *= power
-    origin = getattr(origin, 'worldPosition', origin)
+    # Rebind instead of normalizing in place (which mutated the caller's
+    # vector) and skip the sqrt for already-unit directions.
+    l2 = aim.length_squared
+    if not l2:
+        aim = Vector((0.0, 0.0, 0.0))
+    elif abs(l2 - 1.0) > 1e-6:
+        aim = aim * (power / sqrt(l2))
+    else:
+        aim = aim * power
 
-    points: list = [origin]
+    origin = Vector(origin)
+    # Plain coordinate tuples while sampling; Vectors are materialized
+    # once for the returned point list.
+    coords: list = [(origin.x, origin.y, origin.z)]
     color: list = [1, 0, 0]
-    idx = 0
     total_dist: float = 0
-
-    grav = gravity if gravity else logic.getCurrentScene().gravity
-    while total_dist < distance:
-        target = (calc_projectile(idx, aim, origin, grav))
-        start = origin if not points else points[-1]
-        obj, point, normal = caster.rayCast(
-            start,
-            target,
-            prop=prop,
-            xray=xray,
-            mask=mask
-        )
-        total_dist += (target-start).length
-        if not obj:
-            points.append(target)
+    obj = point = normal = None
+    start = origin
+    # Two scratch vectors alternate as the segment target: `start` keeps
+    # referencing the previous one, so a single scratch cannot be reused.
+    # rayCast copies its arguments internally, making the overwrite safe.
+    scratch = (Vector((0.0, 0.0, 0.0)), Vector((0.0, 0.0, 0.0)))
+    flip = 0
+
+    scene = logic.getCurrentScene()
+    grav = gravity if gravity else scene.gravity
+    tree = None
+    if PROJECTILE_BROADPHASE:
+        from ._bvh import get_scene_bvh, box_tree
+        tree = get_scene_bvh(scene)
+    # Sample count estimate; segment lengths only grow once gravity bends
+    # the arc, so this covers the distance except for steep upward throws,
+    # which continue with another chunk below.
+    speed = aim.length
+    chunk = int(distance / (speed * resolution)) + 2 if speed else 2
+    t_offset = 0.0
+    done = False
+    while not done:
+        t = t_offset + np.arange(1, chunk + 1) * resolution
+        xs = 0.5 * grav.x * t * t + aim.x * t + origin.x
+        ys = 0.5 * grav.y * t * t + aim.y * t + origin.y
+        zs = 0.5 * grav.z * t * t + aim.z * t + origin.z
+        swept_clear = False
+        if tree is not None:
+            # One swept-volume query over the whole chunk; if the arc's
+            # bounding box touches nothing, every segment query is skipped.
+            pad = 0.01
+            sweep = box_tree(
+                (
+                    min(xs.min(), start.x) - pad,
+                    min(ys.min(), start.y) - pad,
+                    min(zs.min(), start.z) - pad
+                ),
+                (
+                    max(xs.max(), start.x) + pad,
+                    max(ys.max(), start.y) + pad,
+                    max(zs.max(), start.z) + pad
+                )
+            )
+            swept_clear = not tree.overlap(sweep)
+        for i in range(chunk):
+            target = scratch[flip]
+            flip = 1 - flip
+            target.x = xs[i]
+            target.y = ys[i]
+            target.z = zs[i]
+            if swept_clear:
+                total_dist += (target - start).length
+                coords.append(target[:])
+                start = target
+                if total_dist >= distance:
+                    done = True
+                    break
+                continue
+            if tree is not None:
+                seg = target - start
+                seg_len = seg.length
+                if seg_len and tree.ray_cast(start, seg, seg_len)[0] is None:
+                    # Nothing near this segment; skip the physics query.
+                    total_dist += seg_len
+                    coords.append(target[:])
+                    start = target
+                    if total_dist >= distance:
+                        done = True
+                        break
+                    continue
+            obj, point, normal = caster.rayCast(
+                start,
+                target,
+                prop=prop,
+                xray=xray,
+                mask=mask
+            )
+            total_dist += (target - start).length
+            if obj:
+                coords.append(point[:])
+                color = [0, 1, 0]
+                done = True
+                break
+            coords.append(target[:])
+            start = target
+            if total_dist >= distance:
+                done = True
+                break
         else:
-            points.append(point)
-            color = [0, 1, 0]
-            break
-        idx += resolution
+            t_offset = t[-1]
     if visualize:
-        for i, p in enumerate(points):
-            if i < len(points) - 1:
-                render.drawLine(p, points[i+1], color)
+        for i in range(len(coords) - 1):
+            render.drawLine(coords[i], coords[i + 1], color)
+    points = [Vector(c) for c in coords]
     return RayCastProjectileData((obj, point, normal, points))
 
 
@@ -382,11 +697,19 @@ def raycast_camera(
     :returns: (`obj`, `point`, `normal`)
     """
     # assume screen coordinates
-    camera = logic.getCurrentScene().active_camera
+    scene = logic.getCurrentScene()
+    camera = scene.active_camera
     if isinstance(aim, Vector) and len(aim) == 2:
         vec = 10 * camera.getScreenVect(aim[0], aim[1])
-        ray_target = camera.worldPosition - vec
-        aim = ray_target
+        aim = camera.worldPosition - vec
+    if STATIC_SCENE and not prop and mask == 65535:
+        obj, point, normal = _bvh_raycast(
+            scene,
+            camera.worldPosition,
+            aim,
+            distance
+        )
+        return RayCastCameraData((obj, point, normal))
     if prop:
         obj, point, normal = camera.rayCast(
             aim,
@@ -420,13 +743,37 @@ def raycast_mouse(
 
     :returns: (`obj`, `point`, `normal`, `direction`)
     """
-    camera = logic.getCurrentScene().active_camera
+    scene = logic.getCurrentScene()
+    camera = scene.active_camera
+    cam_pos = camera.worldPosition
     mpos = logic.mouse.position
     vec = 10 * camera.getScreenVect(*mpos)
-    ray_target = camera.worldPosition - vec
+    ray_target = cam_pos - vec
+    if (
+        STATIC_SCENE and not prop and not material
+        and not exclude and mask == 65535
+    ):
+        obj, point, normal = _bvh_raycast(scene, cam_pos, ray_target, distance)
+        return RayCastData(
+            (obj, point, normal, (ray_target - cam_pos).normalized())
+        )
+    if not material and not exclude:
+        # Common cursor ray without material filtering: cast directly
+        # and skip the full raycast machinery.
+        obj, point, normal = camera.rayCast(
+            ray_target,
+            cam_pos,
+            distance,
+            prop,
+            xray=xray,
+            mask=mask
+        )
+        return RayCastData(
+            (obj, point, normal, (ray_target - cam_pos).normalized())
+        )
     return raycast(
         camera,
-        camera.worldPosition,
+        cam_pos,
         ray_target,
         distance,
         prop,